@@ -1,20 +1,16 @@
 import os
-import time
 from pathlib import Path
 from deepgram_test import transcribe_deepgram
 from assemblyai_test import transcribe_assemblyai
 from gladia_test import transcribe_gladia
 import logging
+from stt_logging import setup_logging, log_phase, run_log_path
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(message)s'
-)
 logger = logging.getLogger(__name__)
 
 def analyze_stt_services(audio_path):
     """Analyze and compare results from all STT services."""
+    file_name = os.path.basename(audio_path)
     results = {
         "deepgram": {"transcript": "", "time": 0, "status": "❌ Failed"},
         "assemblyai": {"transcript": "", "time": 0, "status": "❌ Failed"},
@@ -23,9 +19,9 @@ def analyze_stt_services(audio_path):
     
     # Test Deepgram
     try:
-        start_time = time.time()
-        deepgram_result = transcribe_deepgram(audio_path)
-        deepgram_time = time.time() - start_time
+        with log_phase(logger, "transcribe", provider="deepgram", file=file_name) as timing:
+            deepgram_result = transcribe_deepgram(audio_path)
+        deepgram_time = timing.duration
         
         transcript = deepgram_result.get("results", {}).get("channels", [{}])[0].get("alternatives", [{}])[0].get("transcript", "")
         confidence = deepgram_result.get("results", {}).get("channels", [{}])[0].get("alternatives", [{}])[0].get("confidence", 0)
@@ -36,16 +32,16 @@ def analyze_stt_services(audio_path):
             "confidence": f"{confidence:.2%}",
             "status": "✅ Success"
         }
-        logger.info("Deepgram transcription completed")
+        logger.info("Deepgram transcription completed", extra={"provider": "deepgram", "file": file_name})
     except Exception as e:
         results["deepgram"]["error"] = str(e)
-        logger.error(f"Deepgram error: {str(e)}")
+        logger.error(f"Deepgram error: {str(e)}", extra={"provider": "deepgram", "file": file_name})
     
     # Test AssemblyAI
     try:
-        start_time = time.time()
-        assemblyai_result = transcribe_assemblyai(audio_path)
-        assemblyai_time = time.time() - start_time
+        with log_phase(logger, "transcribe", provider="assemblyai", file=file_name) as timing:
+            assemblyai_result = transcribe_assemblyai(audio_path)
+        assemblyai_time = timing.duration
         
         transcript = assemblyai_result.get("text", "")
         confidence = assemblyai_result.get("confidence", 0)
@@ -56,16 +52,16 @@ def analyze_stt_services(audio_path):
             "confidence": f"{confidence:.2%}",
             "status": "✅ Success"
         }
-        logger.info("AssemblyAI transcription completed")
+        logger.info("AssemblyAI transcription completed", extra={"provider": "assemblyai", "file": file_name})
     except Exception as e:
         results["assemblyai"]["error"] = str(e)
-        logger.error(f"AssemblyAI error: {str(e)}")
+        logger.error(f"AssemblyAI error: {str(e)}", extra={"provider": "assemblyai", "file": file_name})
     
     # Test Gladia
     try:
-        start_time = time.time()
-        gladia_result = transcribe_gladia(audio_path)
-        gladia_time = time.time() - start_time
+        with log_phase(logger, "transcribe", provider="gladia", file=file_name) as timing:
+            gladia_result = transcribe_gladia(audio_path)
+        gladia_time = timing.duration
         
         results["gladia"] = {
             "transcript": gladia_result.get("text", ""),
@@ -73,18 +69,20 @@ def analyze_stt_services(audio_path):
             "confidence": f"{gladia_result.get('confidence', 0):.2%}",
             "status": "✅ Success"
         }
-        logger.info("Gladia transcription completed")
+        logger.info("Gladia transcription completed", extra={"provider": "gladia", "file": file_name})
     except Exception as e:
         results["gladia"]["error"] = str(e)
-        logger.error(f"Gladia error: {str(e)}")
+        logger.error(f"Gladia error: {str(e)}", extra={"provider": "gladia", "file": file_name})
     
     return results
 
-def generate_report(results, audio_file):
+def generate_report(results, audio_file, run_id=None):
     """Generate a detailed report of the analysis."""
     report = f"""
 # STT Service Analysis Report
 Audio File: {os.path.basename(audio_file)}
+Run ID: {run_id or 'N/A'}
+Log File: {run_log_path(run_id) if run_id else 'N/A'}
 
 ## Deepgram Results
 Status: {results['deepgram']['status']}
@@ -134,11 +132,12 @@ def main():
     audio_file = "audio_samples/test_audio.mp3"
     
     # Run analysis
+    run_id = setup_logging()
     logger.info("Starting STT service analysis...")
     results = analyze_stt_services(audio_file)
     
     # Generate report
-    report = generate_report(results, audio_file)
+    report = generate_report(results, audio_file, run_id)
     
     # Save report
     report_file = results_dir / "stt_analysis_report.md"
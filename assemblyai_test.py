@@ -3,13 +3,13 @@ import requests
 import logging
 from pathlib import Path
 import time
+from stt_logging import setup_logging, log_phase
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 def transcribe_assemblyai(audio_file):
     """Transcribe audio using AssemblyAI API with enhanced configuration"""
+    context = {"provider": "assemblyai", "file": os.path.basename(audio_file)}
     try:
         # Check if file exists
         if not os.path.exists(audio_file):
@@ -17,7 +17,7 @@ def transcribe_assemblyai(audio_file):
         
         # Log file size for diagnostics
         file_size = os.path.getsize(audio_file)
-        logger.info(f"Processing file: {audio_file} (Size: {file_size/1024/1024:.2f} MB)")
+        logger.info(f"Processing file: {audio_file} (Size: {file_size/1024/1024:.2f} MB)", extra=context)
         
         # AssemblyAI API configuration
         API_KEY = os.getenv("ASSEMBLYAI_API_KEY")
@@ -35,18 +35,19 @@ def transcribe_assemblyai(audio_file):
         }
         
         # Upload the audio file
-        with open(audio_file, "rb") as f:
-            upload_response = requests.post(
-                UPLOAD_URL,
-                headers={"authorization": API_KEY},
-                data=f
-            )
-        
-        if upload_response.status_code != 200:
-            raise Exception(f"Upload failed: {upload_response.text}")
+        with log_phase(logger, "upload", **context):
+            with open(audio_file, "rb") as f:
+                upload_response = requests.post(
+                    UPLOAD_URL,
+                    headers={"authorization": API_KEY},
+                    data=f
+                )
+            
+            if upload_response.status_code != 200:
+                raise Exception(f"Upload failed: {upload_response.text}")
         
         audio_url = upload_response.json()["upload_url"]
-        logger.info("Audio file uploaded successfully")
+        logger.info("Audio file uploaded successfully", extra=context)
         
         # Configure transcription request
         transcript_request = {
@@ -71,46 +72,49 @@ def transcribe_assemblyai(audio_file):
         }
         
         # Request transcription
-        transcript_response = requests.post(
-            TRANSCRIPT_URL,
-            json=transcript_request,
-            headers=headers
-        )
-        
-        if transcript_response.status_code != 200:
-            raise Exception(f"Transcription request failed: {transcript_response.text}")
+        with log_phase(logger, "submit", **context):
+            transcript_response = requests.post(
+                TRANSCRIPT_URL,
+                json=transcript_request,
+                headers=headers
+            )
+            
+            if transcript_response.status_code != 200:
+                raise Exception(f"Transcription request failed: {transcript_response.text}")
         
         transcript_id = transcript_response.json().get("id")
         if not transcript_id:
             raise Exception("No transcript ID received")
         
-        logger.info(f"Transcription started with ID: {transcript_id}")
+        logger.info(f"Transcription started with ID: {transcript_id}", extra=context)
         
         # Poll for completion
-        while True:
-            polling_response = requests.get(
-                f"{TRANSCRIPT_URL}/{transcript_id}",
-                headers=headers
-            )
-            
-            if polling_response.status_code != 200:
-                raise Exception(f"Polling failed: {polling_response.text}")
-            
-            polling_result = polling_response.json()
-            status = polling_result.get("status")
-            
-            if status == "completed":
-                logger.info("Transcription completed successfully")
-                return polling_result
-            elif status == "error":
-                raise Exception(f"Transcription failed: {polling_result.get('error')}")
-            
-            time.sleep(3)  # Wait before polling again
+        with log_phase(logger, "poll", **context):
+            while True:
+                polling_response = requests.get(
+                    f"{TRANSCRIPT_URL}/{transcript_id}",
+                    headers=headers
+                )
+                
+                if polling_response.status_code != 200:
+                    raise Exception(f"Polling failed: {polling_response.text}")
+                
+                polling_result = polling_response.json()
+                status = polling_result.get("status")
+                
+                if status == "completed":
+                    logger.info("Transcription completed successfully", extra=context)
+                    return polling_result
+                elif status == "error":
+                    raise Exception(f"Transcription failed: {polling_result.get('error')}")
+                
+                time.sleep(3)  # Wait before polling again
         
     except Exception as e:
-        logger.error(f"AssemblyAI transcription error: {str(e)}")
+        logger.error(f"AssemblyAI transcription error: {str(e)}", extra=context)
         raise
 
 if __name__ == "__main__":
+    setup_logging()
     result = transcribe_assemblyai("audio_samples/test_audio.mp3")
     print(result)
@@ -1,8 +1,11 @@
 from deepgram_test import transcribe_deepgram
 from assemblyai_test import transcribe_assemblyai
+from stt_logging import setup_logging
 
 AUDIO_FILE = "audio_samples/test_audio.mp3"
 
+setup_logging()
+
 deepgram_result = transcribe_deepgram(AUDIO_FILE)
 assemblyai_result = transcribe_assemblyai(AUDIO_FILE)
 
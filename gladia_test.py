@@ -2,12 +2,8 @@ import requests
 import os
 from dotenv import load_dotenv
 import logging
+from stt_logging import setup_logging, log_phase
 
-# Configure logging to show only INFO and above
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(message)s'  # Simplified format to show only the message
-)
 logger = logging.getLogger(__name__)
 
 load_dotenv()
@@ -17,6 +13,7 @@ AUDIO_FILE = "audio_samples/test_audio.mp3"
 
 def transcribe_gladia(audio_path):
     """Transcribe audio using Gladia API."""
+    context = {"provider": "gladia", "file": os.path.basename(audio_path)}
     try:
         # Get API key
         api_key = os.getenv("GLADIA_API_KEY")
@@ -27,7 +24,7 @@ def transcribe_gladia(audio_path):
         if not os.path.exists(audio_path):
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
         
-        logger.info(f"Processing: {os.path.basename(audio_path)}")
+        logger.info(f"Processing: {os.path.basename(audio_path)}", extra=context)
 
         # API endpoint
         url = "https://api.gladia.io/audio/text/transcription"
@@ -40,13 +37,14 @@ def transcribe_gladia(audio_path):
         # Upload and transcribe
         with open(audio_path, 'rb') as f:
             files = {'audio': f}
-            response = requests.post(url, files=files, headers=headers)
-            
-            if response.status_code not in [200, 201]:
-                raise Exception(f"Request failed: {response.text}")
+            with log_phase(logger, "upload", **context):
+                response = requests.post(url, files=files, headers=headers)
+                
+                if response.status_code not in [200, 201]:
+                    raise Exception(f"Request failed: {response.text}")
             
             result = response.json()
-            logger.info("Transcription completed successfully")
+            logger.info("Transcription completed successfully", extra=context)
             
             return {
                 "text": result.get("transcription", ""),
@@ -54,9 +52,10 @@ def transcribe_gladia(audio_path):
             }
                 
     except Exception as e:
-        logger.error(f"Error: {str(e)}")
+        logger.error(f"Error: {str(e)}", extra=context)
         raise
 
 if __name__ == "__main__":
+    setup_logging()
     result = transcribe_gladia(AUDIO_FILE)
     print(result) 
\ No newline at end of file
@@ -4,11 +4,9 @@ from pathlib import Path
 from deepgram_test import transcribe_deepgram
 from assemblyai_test import transcribe_assemblyai
 from gladia_test import transcribe_gladia
-import time
 import logging
+from stt_logging import setup_logging, log_phase, run_context, run_log_path
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 def process_audio(audio_file):
@@ -16,119 +14,125 @@ def process_audio(audio_file):
     if not audio_file:
         return "Please upload an audio file first."
     
-    # Initialize results with default values for all required keys
-    results = {
-        "deepgram": {
-            "status": "❌ Failed",
-            "transcript": "No transcript available",
-            "time": "N/A",
-            "confidence": "N/A",
-            "error": None
-        },
-        "assemblyai": {
-            "status": "❌ Failed",
-            "transcript": "No transcript available",
-            "time": "N/A",
-            "confidence": "N/A",
-            "error": None
-        },
-        "gladia": {
-            "status": "❌ Failed",
-            "transcript": "No transcript available",
-            "time": "N/A",
-            "confidence": "N/A",
-            "error": None
-        }
-    }
-    
-    try:
-        # Process with Deepgram
-        start_time = time.time()
-        deepgram_result = transcribe_deepgram(audio_file)
-        deepgram_time = time.time() - start_time
-        
-        # Extract just the transcript from Deepgram's response
-        transcript = deepgram_result.get("results", {}).get("channels", [{}])[0].get("alternatives", [{}])[0].get("transcript", "")
-        confidence = deepgram_result.get("results", {}).get("channels", [{}])[0].get("alternatives", [{}])[0].get("confidence", 0)
-        
-        results["deepgram"].update({
-            "status": "✅ Success",
-            "transcript": transcript or "No transcript available",
-            "time": f"{deepgram_time:.2f}s",
-            "confidence": f"{confidence:.2%}"
-        })
-        logger.info("Deepgram transcription completed successfully")
-    except Exception as e:
-        error_msg = str(e)
-        results["deepgram"].update({
-            "error": error_msg,
-            "transcript": f"Error: {error_msg}"
-        })
-        logger.error(f"Deepgram error: {error_msg}")
-    
-    try:
-        # Process with AssemblyAI
-        start_time = time.time()
-        assemblyai_result = transcribe_assemblyai(audio_file)
-        assemblyai_time = time.time() - start_time
+    with run_context() as run_id:
+        file_name = os.path.basename(audio_file)
         
-        transcript = assemblyai_result.get("text", "")
-        confidence = assemblyai_result.get("confidence", 0)
+        # Initialize results with default values for all required keys
+        results = {
+            "deepgram": {
+                "status": "❌ Failed",
+                "transcript": "No transcript available",
+                "time": "N/A",
+                "confidence": "N/A",
+                "error": None
+            },
+            "assemblyai": {
+                "status": "❌ Failed",
+                "transcript": "No transcript available",
+                "time": "N/A",
+                "confidence": "N/A",
+                "error": None
+            },
+            "gladia": {
+                "status": "❌ Failed",
+                "transcript": "No transcript available",
+                "time": "N/A",
+                "confidence": "N/A",
+                "error": None
+            }
+        }
         
-        results["assemblyai"].update({
-            "status": "✅ Success",
-            "transcript": transcript or "No transcript available",
-            "time": f"{assemblyai_time:.2f}s",
-            "confidence": f"{confidence:.2%}"
-        })
-        logger.info("AssemblyAI transcription completed successfully")
-    except Exception as e:
-        error_msg = str(e)
-        results["assemblyai"].update({
-            "error": error_msg,
-            "transcript": f"Error: {error_msg}"
-        })
-        logger.error(f"AssemblyAI error: {error_msg}")
-    
-    try:
-        # Process with Gladia
-        start_time = time.time()
-        gladia_result = transcribe_gladia(audio_file)
-        gladia_time = time.time() - start_time
+        try:
+            # Process with Deepgram
+            with log_phase(logger, "transcribe", provider="deepgram", file=file_name) as timing:
+                deepgram_result = transcribe_deepgram(audio_file)
+            deepgram_time = timing.duration
+            
+            # Extract just the transcript from Deepgram's response
+            transcript = deepgram_result.get("results", {}).get("channels", [{}])[0].get("alternatives", [{}])[0].get("transcript", "")
+            confidence = deepgram_result.get("results", {}).get("channels", [{}])[0].get("alternatives", [{}])[0].get("confidence", 0)
+            
+            results["deepgram"].update({
+                "status": "✅ Success",
+                "transcript": transcript or "No transcript available",
+                "time": f"{deepgram_time:.2f}s",
+                "confidence": f"{confidence:.2%}"
+            })
+            logger.info("Deepgram transcription completed successfully", extra={"provider": "deepgram", "file": file_name})
+        except Exception as e:
+            error_msg = str(e)
+            results["deepgram"].update({
+                "error": error_msg,
+                "transcript": f"Error: {error_msg}"
+            })
+            logger.error(f"Deepgram error: {error_msg}", extra={"provider": "deepgram", "file": file_name})
         
-        # Handle Gladia response structure
-        transcript = ""
-        confidence = 1.0  # Default confidence
+        try:
+            # Process with AssemblyAI
+            with log_phase(logger, "transcribe", provider="assemblyai", file=file_name) as timing:
+                assemblyai_result = transcribe_assemblyai(audio_file)
+            assemblyai_time = timing.duration
+            
+            transcript = assemblyai_result.get("text", "")
+            confidence = assemblyai_result.get("confidence", 0)
+            
+            results["assemblyai"].update({
+                "status": "✅ Success",
+                "transcript": transcript or "No transcript available",
+                "time": f"{assemblyai_time:.2f}s",
+                "confidence": f"{confidence:.2%}"
+            })
+            logger.info("AssemblyAI transcription completed successfully", extra={"provider": "assemblyai", "file": file_name})
+        except Exception as e:
+            error_msg = str(e)
+            results["assemblyai"].update({
+                "error": error_msg,
+                "transcript": f"Error: {error_msg}"
+            })
+            logger.error(f"AssemblyAI error: {error_msg}", extra={"provider": "assemblyai", "file": file_name})
         
-        if isinstance(gladia_result, dict):
-            if "transcription" in gladia_result:
-                transcript = gladia_result["transcription"]
-            elif "text" in gladia_result:
-                transcript = gladia_result["text"]
-            elif "prediction" in gladia_result:
-                transcript = gladia_result["prediction"]
+        try:
+            # Process with Gladia
+            with log_phase(logger, "transcribe", provider="gladia", file=file_name) as timing:
+                gladia_result = transcribe_gladia(audio_file)
+            gladia_time = timing.duration
+            
+            # Handle Gladia response structure
+            transcript = ""
+            confidence = 1.0  # Default confidence
+            
+            if isinstance(gladia_result, dict):
+                if "transcription" in gladia_result:
+                    transcript = gladia_result["transcription"]
+                elif "text" in gladia_result:
+                    transcript = gladia_result["text"]
+                elif "prediction" in gladia_result:
+                    transcript = gladia_result["prediction"]
+                
+                confidence = gladia_result.get("confidence", 1.0)
             
-            confidence = gladia_result.get("confidence", 1.0)
+            results["gladia"].update({
+                "status": "✅ Success",
+                "transcript": transcript or "No transcript available",
+                "time": f"{gladia_time:.2f}s",
+                "confidence": f"{confidence:.2%}"
+            })
+            logger.info("Gladia transcription completed successfully", extra={"provider": "gladia", "file": file_name})
+        except Exception as e:
+            error_msg = str(e)
+            results["gladia"].update({
+                "error": error_msg,
+                "transcript": f"Error: {error_msg}"
+            })
+            logger.error(f"Gladia error: {error_msg}", extra={"provider": "gladia", "file": file_name})
         
-        results["gladia"].update({
-            "status": "✅ Success",
-            "transcript": transcript or "No transcript available",
-            "time": f"{gladia_time:.2f}s",
-            "confidence": f"{confidence:.2%}"
-        })
-        logger.info("Gladia transcription completed successfully")
-    except Exception as e:
-        error_msg = str(e)
-        results["gladia"].update({
-            "error": error_msg,
-            "transcript": f"Error: {error_msg}"
-        })
-        logger.error(f"Gladia error: {error_msg}")
-    
-    # Format results as markdown
-    markdown = """
+        # Format results as markdown
+        markdown = """
 # Transcription Results
 
+**Run ID**: {run_id}
+**Log File**: {log_file}
+
 ## Deepgram
 **Status**: {deepgram[status]}
 **Processing Time**: {deepgram[time]}
@@ -149,9 +153,9 @@ def process_audio(audio_file):
 **Confidence**: {gladia[confidence]}
 **Transcript**:
 {gladia[transcript]}
-""".format(**results)
-    
-    return markdown
+""".format(run_id=run_id, log_file=run_log_path(run_id), **results)
+        
+        return markdown
 
 # Create Gradio interface
 with gr.Blocks(title="STT Service Comparison", theme=gr.themes.Soft()) as demo:
@@ -189,6 +193,7 @@ with gr.Blocks(title="STT Service Comparison", theme=gr.themes.Soft()) as demo:
     """)
 
 if __name__ == "__main__":
+    setup_logging()
     demo.launch(
         server_name="127.0.0.1",  # Use localhost instead of 0.0.0.0
         server_port=7860,
@@ -0,0 +1,310 @@
+import os
+import copy
+import gzip
+import json
+import time
+import uuid
+import queue
+import atexit
+import shutil
+import logging
+import logging.handlers
+from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from contextvars import ContextVar
+from pathlib import Path
+from datetime import datetime, timezone
+from contextlib import contextmanager
+
+# Default locations for the shared rolling log and the per-run logs
+LOG_DIR = Path("logs")
+RUN_LOG_DIR = Path("test_results") / "logs"
+MAX_LOG_BYTES = 5 * 1024 * 1024  # 5MB
+BACKUP_COUNT = 5
+MAX_RUN_LOGS = 100  # Per-run logs kept under RUN_LOG_DIR
+MAX_OPEN_RUN_LOGS = 8
+
+# Fields copied from `extra=` into each JSON record when present
+CONTEXT_FIELDS = ("run_id", "file", "provider", "phase", "duration")
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_run_id: Optional[str] = None
+_current_run_id: ContextVar[Optional[str]] = ContextVar("run_id", default=None)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for field in CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class RunContextFilter(logging.Filter):
+    """Stamp every record with the id of the current run."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "run_id", None) is None:
+            record.run_id = get_run_id()
+        return True
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that keeps the message and traceback as separate fields."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class CompressingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Size-based rotating handler that gzips rotated files."""
+
+    def __init__(self, filename, max_bytes: int = MAX_LOG_BYTES, backup_count: int = BACKUP_COUNT):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        self.namer = lambda name: f"{name}.gz"
+        self.rotator = self._compress
+
+    @staticmethod
+    def _compress(source: str, dest: str):
+        with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.remove(source)
+
+
+class RunLogFileHandler(CompressingRotatingFileHandler):
+    """Rotating handler for a single run that never deletes old backups.
+
+    Backups are numbered in the order they were written (1 is the oldest),
+    so the full history of a run stays readable by load_run_log.
+    """
+
+    def __init__(self, filename, max_bytes: int = MAX_LOG_BYTES):
+        super().__init__(filename, max_bytes=max_bytes, backup_count=0)
+        self.backups = len(list(Path(self.baseFilename).parent.glob(f"{Path(self.baseFilename).name}.*.gz")))
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        self.backups += 1
+        self.rotate(self.baseFilename, self.rotation_filename(f"{self.baseFilename}.{self.backups}"))
+        if not self.delay:
+            self.stream = self._open()
+
+
+class RunLogRouter(logging.Handler):
+    """Write each record to the log file of its run.
+
+    Files are opened on first use and the least recently used ones are
+    closed once more than MAX_OPEN_RUN_LOGS are open. When a new run log
+    is created, all but the newest MAX_RUN_LOGS runs are deleted, except
+    the process run and runs that are still open.
+    """
+
+    def __init__(self, run_log_dir: Path = RUN_LOG_DIR, max_runs: int = MAX_RUN_LOGS):
+        super().__init__()
+        self.run_log_dir = Path(run_log_dir)
+        self.max_runs = max_runs
+        self.handlers: "OrderedDict[str, RunLogFileHandler]" = OrderedDict()
+
+    def emit(self, record: logging.LogRecord):
+        run_id = getattr(record, "run_id", None)
+        if run_id is None:
+            return
+        try:
+            self._handler_for(run_id).handle(record)
+        except Exception:
+            self.handleError(record)
+
+    def _handler_for(self, run_id: str) -> "RunLogFileHandler":
+        handler = self.handlers.get(run_id)
+        if handler is not None:
+            self.handlers.move_to_end(run_id)
+            return handler
+
+        path = run_log_path(run_id, self.run_log_dir)
+        is_new = not path.exists()
+        handler = RunLogFileHandler(path)
+        handler.setFormatter(self.formatter)
+        self.handlers[run_id] = handler
+        if len(self.handlers) > MAX_OPEN_RUN_LOGS:
+            _, oldest = self.handlers.popitem(last=False)
+            oldest.close()
+        if is_new:
+            self._prune()
+        return handler
+
+    def _prune(self):
+        runs = sorted(self.run_log_dir.glob("*.jsonl"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for path in runs[self.max_runs:]:
+            run_id = path.name[:-len(".jsonl")]
+            if run_id in self.handlers or run_id == _run_id:
+                continue
+            for log_file in [path] + list(path.parent.glob(f"{path.name}.*.gz")):
+                log_file.unlink(missing_ok=True)
+
+    def close(self):
+        for handler in self.handlers.values():
+            handler.close()
+        self.handlers.clear()
+        super().close()
+
+
+class PhaseTiming:
+    """Duration of a log_phase block in seconds, set when the block exits."""
+
+    def __init__(self):
+        self.duration = 0.0
+
+
+def new_run_id() -> str:
+    """Return a sortable, unique id for a new run, e.g. 20250324-075615-1a2b3c."""
+    return f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+def get_run_id() -> Optional[str]:
+    """Return the id of the current run context, or of the process run."""
+    return _current_run_id.get() or _run_id
+
+
+@contextmanager
+def run_context(run_id: Optional[str] = None):
+    """Log records from this context under their own run id and log file.
+
+    Used by the web interface so each request gets its own run, e.g.
+    `with run_context() as run_id: ...`.
+    """
+    run_id = run_id or new_run_id()
+    token = _current_run_id.set(run_id)
+    try:
+        yield run_id
+    finally:
+        _current_run_id.reset(token)
+
+
+def run_log_path(run_id: str, run_log_dir: Path = RUN_LOG_DIR) -> Path:
+    """Return the path of the per-run log file for run_id."""
+    return Path(run_log_dir) / f"{run_id}.jsonl"
+
+
+def setup_logging(run_id: Optional[str] = None,
+                  level: int = logging.INFO,
+                  log_dir: Path = LOG_DIR,
+                  run_log_dir: Path = RUN_LOG_DIR) -> str:
+    """Route all logging through a background queue and return the run id.
+
+    Callers only enqueue records; a listener thread writes them to stderr,
+    to the shared rolling log and to the log of each record's run (see
+    run_context). Calling this again after the first time has no effect.
+    """
+    global _listener, _run_id
+    if _listener is not None:
+        return _run_id
+
+    _run_id = run_id or new_run_id()
+    log_dir = Path(log_dir)
+    log_dir.mkdir(parents=True, exist_ok=True)
+    Path(run_log_dir).mkdir(parents=True, exist_ok=True)
+
+    json_formatter = JsonLinesFormatter()
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+    shared_handler = CompressingRotatingFileHandler(log_dir / "stt.jsonl")
+    shared_handler.setFormatter(json_formatter)
+
+    run_handler = RunLogRouter(run_log_dir)
+    run_handler.setFormatter(json_formatter)
+
+    log_queue = queue.Queue(-1)
+    queue_handler = ContextQueueHandler(log_queue)
+    queue_handler.addFilter(RunContextFilter())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, console_handler, shared_handler, run_handler,
+        respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(shutdown_logging)
+    return _run_id
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+@contextmanager
+def log_phase(logger: logging.Logger, phase: str, **context):
+    """Time a block and log its duration with the given provider/file context.
+
+    Yields a PhaseTiming whose duration is the value written to the log.
+    """
+    timing = PhaseTiming()
+    start_time = time.perf_counter()
+    try:
+        yield timing
+    except Exception:
+        timing.duration = round(time.perf_counter() - start_time, 3)
+        logger.warning(f"{phase} failed after {timing.duration:.2f}s",
+                       extra={"phase": phase, "duration": timing.duration, **context})
+        raise
+    timing.duration = round(time.perf_counter() - start_time, 3)
+    logger.info(f"{phase} completed in {timing.duration:.2f}s",
+                extra={"phase": phase, "duration": timing.duration, **context})
+
+
+def load_run_log(run_id: str, run_log_dir: Path = RUN_LOG_DIR, **filters) -> List[Dict[str, Any]]:
+    """Load the records of a run, oldest first, optionally filtered by field.
+
+    Example: load_run_log(results["run_id"], provider="deepgram", phase="transcribe")
+    """
+    path = run_log_path(run_id, run_log_dir)
+    backups = sorted(path.parent.glob(f"{path.name}.*.gz"),
+                     key=lambda p: int(p.name.split(".")[-2]))
+
+    records = []
+    for log_file in backups + [path]:
+        if not log_file.exists():
+            continue
+        opener = gzip.open if log_file.suffix == ".gz" else open
+        with opener(log_file, "rt", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if all(record.get(key) == value for key, value in filters.items()):
+                    records.append(record)
+    return records
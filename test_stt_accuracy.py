@@ -1,28 +1,21 @@
 import os
-import time
 import json
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from pathlib import Path
 from datetime import datetime
 from deepgram_test import transcribe_deepgram
 from assemblyai_test import transcribe_assemblyai
+from stt_logging import setup_logging, log_phase, run_log_path
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('stt_test_results.log'),
-        logging.StreamHandler()
-    ]
-)
+logger = logging.getLogger(__name__)
 
 class STTAccuracyTester:
-    def __init__(self, audio_dir: str = "audio_samples"):
+    def __init__(self, audio_dir: str = "audio_samples", run_id: Optional[str] = None):
         self.audio_dir = Path(audio_dir)
         self.results_dir = Path("test_results")
         self.results_dir.mkdir(exist_ok=True)
+        self.run_id = run_id
         
     def process_audio_file(self, audio_file: Path) -> Dict[str, Any]:
         """Process a single audio file with both services and return results."""
@@ -30,14 +23,16 @@ class STTAccuracyTester:
             "file_name": audio_file.name,
             "file_size": audio_file.stat().st_size,
             "timestamp": datetime.now().isoformat(),
+            "run_id": self.run_id,
+            "log_file": str(run_log_path(self.run_id)) if self.run_id else None,
             "services": {}
         }
         
         # Test Deepgram
         try:
-            start_time = time.time()
-            deepgram_result = transcribe_deepgram(str(audio_file))
-            deepgram_time = time.time() - start_time
+            with log_phase(logger, "transcribe", provider="deepgram", file=audio_file.name) as timing:
+                deepgram_result = transcribe_deepgram(str(audio_file))
+            deepgram_time = timing.duration
             
             results["services"]["deepgram"] = {
                 "transcript": deepgram_result.get("results", {}).get("channels", [{}])[0].get("alternatives", [{}])[0].get("transcript", ""),
@@ -46,7 +41,8 @@ class STTAccuracyTester:
                 "success": True
             }
         except Exception as e:
-            logging.error(f"Deepgram error processing {audio_file.name}: {str(e)}")
+            logger.error(f"Deepgram error processing {audio_file.name}: {str(e)}",
+                         extra={"provider": "deepgram", "file": audio_file.name})
             results["services"]["deepgram"] = {
                 "error": str(e),
                 "success": False
@@ -54,9 +50,9 @@ class STTAccuracyTester:
         
         # Test AssemblyAI
         try:
-            start_time = time.time()
-            assemblyai_result = transcribe_assemblyai(str(audio_file))
-            assemblyai_time = time.time() - start_time
+            with log_phase(logger, "transcribe", provider="assemblyai", file=audio_file.name) as timing:
+                assemblyai_result = transcribe_assemblyai(str(audio_file))
+            assemblyai_time = timing.duration
             
             results["services"]["assemblyai"] = {
                 "transcript": assemblyai_result.get("text", ""),
@@ -65,7 +61,8 @@ class STTAccuracyTester:
                 "success": True
             }
         except Exception as e:
-            logging.error(f"AssemblyAI error processing {audio_file.name}: {str(e)}")
+            logger.error(f"AssemblyAI error processing {audio_file.name}: {str(e)}",
+                         extra={"provider": "assemblyai", "file": audio_file.name})
             results["services"]["assemblyai"] = {
                 "error": str(e),
                 "success": False
@@ -78,29 +75,32 @@ class STTAccuracyTester:
         result_file = self.results_dir / f"{audio_file.stem}_results.json"
         with open(result_file, 'w') as f:
             json.dump(results, f, indent=2)
-        logging.info(f"Results saved to {result_file}")
+        logger.info(f"Results saved to {result_file}", extra={"file": audio_file.name})
     
     def run_tests(self):
         """Run tests on all audio files in the audio directory."""
         audio_files = list(self.audio_dir.glob("*.mp3")) + list(self.audio_dir.glob("*.wav"))
         
         if not audio_files:
-            logging.error("No audio files found in the audio_samples directory")
+            logger.error("No audio files found in the audio_samples directory")
             return
         
-        logging.info(f"Found {len(audio_files)} audio files to test")
+        logger.info(f"Found {len(audio_files)} audio files to test")
         
         for audio_file in audio_files:
-            logging.info(f"Processing {audio_file.name}")
+            logger.info(f"Processing {audio_file.name}", extra={"file": audio_file.name})
             results = self.process_audio_file(audio_file)
             self.save_results(results, audio_file)
             
             # Print summary
             if results["services"]["deepgram"]["success"]:
-                logging.info(f"Deepgram transcript: {results['services']['deepgram']['transcript'][:100]}...")
+                logger.info(f"Deepgram transcript: {results['services']['deepgram']['transcript'][:100]}...",
+                            extra={"provider": "deepgram", "file": audio_file.name})
             if results["services"]["assemblyai"]["success"]:
-                logging.info(f"AssemblyAI transcript: {results['services']['assemblyai']['transcript'][:100]}...")
+                logger.info(f"AssemblyAI transcript: {results['services']['assemblyai']['transcript'][:100]}...",
+                            extra={"provider": "assemblyai", "file": audio_file.name})
 
 if __name__ == "__main__":
-    tester = STTAccuracyTester()
+    run_id = setup_logging()
+    tester = STTAccuracyTester(run_id=run_id)
     tester.run_tests() 
\ No newline at end of file